@@ -34,7 +34,7 @@ After=network.target
 User=$CURRENT_USER
 WorkingDirectory=$INSTALL_DIR
 Environment="PATH=/home/$CURRENT_USER/.local/bin:/usr/local/bin:/usr/bin:/bin"
-ExecStart=/home/$CURRENT_USER/.local/bin/gunicorn --bind 0.0.0.0:5000 --workers 1 --threads 4 --timeout 120 pocsag2025:app
+ExecStart=/home/$CURRENT_USER/.local/bin/gunicorn --bind 0.0.0.0:5000 --workers 1 --threads 4 --timeout 120 --keep-alive 15 pocsag2025:app
 Restart=always
 RestartSec=10
 StandardOutput=append:$INSTALL_DIR/gunicorn.log